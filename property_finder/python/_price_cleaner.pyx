@@ -0,0 +1,88 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Native price parser for Property Finder
+
+Parses raw price strings such as '₹ 1.5 Crore', 'Rs 45 Lakh' or '85,00,000'
+in a single pass over each string's UTF-8 bytes. Built on demand through
+pyximport by data_cleaner.py.
+"""
+
+from libc.math cimport NAN
+from libc.stdlib cimport strtod
+
+cdef extern from "Python.h":
+    const char* PyUnicode_AsUTF8(object unicode) except NULL
+
+# Longest digit run (commas removed) that is still parsed
+cdef enum:
+    MAX_DIGITS = 63
+
+
+cdef inline bint _is_number_char(char c) nogil:
+    return (c >= b'0' and c <= b'9') or c == b'.' or c == b','
+
+
+cdef inline bint _starts_with_ci(const char* s, const char* word) nogil:
+    """Case-insensitive ASCII prefix check"""
+    cdef int i = 0
+    while word[i] != 0:
+        if s[i] == 0 or (s[i] | 0x20) != word[i]:
+            return False
+        i += 1
+    return True
+
+
+cdef double _parse_price(const char* s) nogil:
+    cdef char buf[MAX_DIGITS + 1]
+    cdef char* end
+    cdef int n = 0
+    cdef double value
+
+    # Skip currency symbols and anything else before the first number;
+    # negative prices are invalid rather than silently made positive
+    while s[0] != 0 and not _is_number_char(s[0]):
+        if s[0] == b'-':
+            return NAN
+        s += 1
+    if s[0] == 0:
+        return NAN
+
+    # Copy the number, dropping thousands separators
+    while _is_number_char(s[0]):
+        if s[0] != b',':
+            if n == MAX_DIGITS:
+                return NAN
+            buf[n] = s[0]
+            n += 1
+        s += 1
+    if n == 0:
+        return NAN
+    # Scientific notation would otherwise be truncated to its mantissa
+    if s[0] == b'e' or s[0] == b'E':
+        return NAN
+    buf[n] = 0
+
+    value = strtod(buf, &end)
+    if end != buf + n:
+        return NAN
+
+    # Optional unit right after the number
+    while s[0] == b' ' or s[0] == b'\t':
+        s += 1
+    if _starts_with_ci(s, b'crore'):
+        return value * 10000000
+    if _starts_with_ci(s, b'lakh'):
+        return value * 100000
+    return value
+
+
+cpdef parse_prices(list values, double[:] out):
+    """Parse each raw price in values into out; unparseable entries become NaN"""
+    cdef Py_ssize_t i
+    cdef object value
+    for i in range(len(values)):
+        value = values[i]
+        if isinstance(value, str):
+            out[i] = _parse_price(PyUnicode_AsUTF8(value))
+        else:
+            out[i] = NAN
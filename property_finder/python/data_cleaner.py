@@ -7,36 +7,296 @@ This script loads raw property data, cleans it, and prepares it for the C++ back
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import LabelEncoder, StandardScaler
+import contextlib
+import io
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# Copy-on-write is always on from pandas 3.0
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+# Native price parser, compiled from _price_cleaner.pyx on first import
+try:
+    import pyximport
+    _pyx_importers = pyximport.install(language_level=3)
+    try:
+        from _price_cleaner import parse_prices
+    finally:
+        pyximport.uninstall(*_pyx_importers)
+except ImportError:
+    parse_prices = None
+
+# Bytes of CSV text parsed per streamed record batch
+CSV_BLOCK_SIZE = 64 << 20
+
+# Rows read to fit imputation statistics when no streaming reader is available
+FIT_SAMPLE_ROWS = 500_000
+
+# Area unit suffixes stripped from the Size column, with surrounding spaces
+SIZE_UNIT_PATTERN = re.compile(r'\s*(?:sq\s*\.?\s*ft|sqft|sq\s*feet|square\s*feet)\s*', re.IGNORECASE)
+
+# Number, exponent marker and optional Crore/Lakh unit in a raw price string.
+# Anchored so a minus sign before the number fails the match; a captured
+# exponent marker also makes the price invalid (matches _price_cleaner.pyx)
+PRICE_PATTERN = re.compile(r'^[^0-9.,-]*([0-9.,]+)(e)?\s*(crore|lakh)?', re.IGNORECASE)
+PRICE_UNITS = {'crore': 10000000, 'lakh': 100000}
+
+# Realistic price (₹) and size (sq ft) ranges
+PRICE_RANGE = (100000, 1000000000)
+SIZE_RANGE = (200, 10000)
+
+# India coordinate bounds (approximate)
+LAT_RANGE = (8.0, 37.0)
+LON_RANGE = (68.0, 97.0)
+
+# Common city name mappings
+CITY_MAPPINGS = {
+    'Bombay': 'Mumbai',
+    'Bangalore': 'Bengaluru',
+    'Calcutta': 'Kolkata',
+    'Madras': 'Chennai',
+    'New Delhi': 'Delhi',
+    'Gurgaon': 'Gurugram'
+}
+
+# Common property type mappings
+TYPE_MAPPINGS = {
+    'Flat': 'Apartment',
+    'Builder Floor': 'Apartment',
+    'Independent House': 'House',
+    'Villa': 'House',
+    'Plot': 'Land'
+}
+
+if njit is not None:
+    # NaN prices and zero sizes are legitimate inputs here, so keep strict
+    # IEEE semantics (no fastmath) and NumPy-style division by zero
+    @njit(parallel=True, cache=True, error_model='numpy')
+    def _derive_features(price, size, beds, baths, pps_out, ratio_out):
+        """Compute price per sqft and bath/bed ratio in one pass over the rows"""
+        for i in prange(len(price)):
+            pps_out[i] = price[i] / size[i]
+            b = beds[i] if beds[i] != 0 else 1.0
+            ratio_out[i] = baths[i] / b
+else:
+    def _derive_features(price, size, beds, baths, pps_out, ratio_out):
+        """Compute price per sqft and bath/bed ratio with NumPy ufuncs"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(price, size, out=pps_out)
+            np.divide(baths, np.where(beds == 0, 1.0, beds), out=ratio_out)
+
+def _parse_sizes(size_series):
+    """Strip area units from raw sizes and convert them to numeric square feet"""
+    if pd.api.types.is_numeric_dtype(size_series):
+        return size_series
+    
+    sizes = size_series.astype(str)
+    
+    # Remove common suffixes
+    sizes = sizes.str.replace(SIZE_UNIT_PATTERN, '', regex=True)
+    
+    # Convert to numeric
+    return pd.to_numeric(sizes, errors='coerce')
+
+def _nanmedian(series):
+    """Median ignoring NaN, using bottleneck's O(n) selection when available"""
+    values = series.to_numpy(dtype=np.float64)
+    if bn is not None:
+        return float(bn.nanmedian(values))
+    return float(np.nanmedian(values))
 
 class PropertyDataCleaner:
     def __init__(self):
         self.label_encoders = {}
         self.scaler = StandardScaler()
+        self.stats_ = {}
         
-    def load_raw_data(self, filename):
+    def load_raw_data(self, filename, chunksize=CSV_BLOCK_SIZE):
         """Load raw property data from CSV file"""
         try:
             print(f"Loading data from {filename}...")
-            df = pd.read_csv(filename)
+            if pa is not None:
+                # Stream record batches and convert to pandas once at the end
+                reader = self._open_csv_stream(filename, chunksize)
+                table = pa.Table.from_batches(list(reader), schema=reader.schema)
+                df = table.to_pandas(types_mapper=_arrow_types_mapper)
+            else:
+                df = pd.read_csv(filename)
             print(f"Loaded {len(df)} rows with {len(df.columns)} columns")
             return df
         except Exception as e:
             print(f"Error loading data: {e}")
             return None
     
+    def iter_raw_data(self, filename, chunksize=CSV_BLOCK_SIZE):
+        """Yield raw property data from CSV file one chunk of about chunksize bytes at a time"""
+        if pa is None:
+            yield pd.read_csv(filename)
+            return
+        
+        reader = self._open_csv_stream(filename, chunksize)
+        while True:
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                break
+            yield batch.to_pandas(types_mapper=_arrow_types_mapper)
+    
+    def clean_data_chunked(self, filename, chunksize=CSV_BLOCK_SIZE):
+        """Clean a large CSV file chunk by chunk and combine the results"""
+        frames = []
+        for chunk in self.iter_raw_data(filename, chunksize):
+            # Fit the imputation statistics on the first chunk only
+            if not frames:
+                self.fit(chunk)
+            frames.append(self.transform(chunk))
+        return self._combine_cleaned_chunks(frames)
+    
+    def clean_data_parallel(self, path, workers=None):
+        """Clean a large CSV file in newline-aligned byte ranges across worker processes"""
+        workers = workers or os.cpu_count() or 1
+        size = os.path.getsize(path)
+        
+        # Split the data section into byte ranges that start on line boundaries
+        with open(path, 'rb') as f:
+            header = f.readline()
+            bounds = [f.tell()]
+            for i in range(1, workers):
+                target = bounds[0] + (size - bounds[0]) * i // workers
+                f.seek(max(target, bounds[-1]) - 1)
+                f.readline()
+                bounds.append(f.tell())
+            bounds.append(size)
+        ranges = [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+        
+        # Fit the imputation statistics once on a bounded sample from the start of the file
+        if pa is not None:
+            with contextlib.closing(self.iter_raw_data(path)) as blocks:
+                sample = next(blocks)
+        else:
+            sample = pd.read_csv(path, nrows=FIT_SAMPLE_ROWS)
+        self.fit(sample)
+        
+        print(f"Cleaning {path} in {len(ranges)} parallel chunks...")
+        starts, ends = zip(*ranges)
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            frames = list(pool.map(_clean_csv_range, repeat(path), repeat(header),
+                                   starts, ends, repeat(self.stats_)))
+        
+        return self._combine_cleaned_chunks(frames)
+    
+    def _combine_cleaned_chunks(self, frames):
+        """Concatenate separately cleaned chunks into one consistent frame"""
+        cleaned_df = pd.concat(frames, ignore_index=True)
+        
+        # Chunks can end up with different categories, which concat turns into object
+        for col in ['City', 'Type']:
+            if col in cleaned_df.columns:
+                cleaned_df[col] = cleaned_df[col].astype('category')
+        
+        # Duplicates can span chunk boundaries
+        cleaned_df = self._drop_duplicates(cleaned_df)
+        print(f"Combined {len(frames)} chunks into {len(cleaned_df)} rows")
+        return cleaned_df
+    
+    def _open_csv_stream(self, filename, chunksize):
+        """Open a streaming PyArrow CSV reader with City/Type dictionary-encoded at parse time"""
+        category_type = pa.dictionary(pa.int32(), pa.string())
+        # The streaming reader infers types from the first block only, so pin every
+        # known column; later blocks may hold '1.5 Crore' prices or imputed 2.5 rooms
+        column_types = {
+            'City': category_type,
+            'Type': category_type,
+            'Price': pa.string(),
+            'Size': pa.string(),
+            'Bedrooms': pa.float64(),
+            'Bathrooms': pa.float64(),
+            'Latitude': pa.float64(),
+            'Longitude': pa.float64()
+        }
+        return pacsv.open_csv(
+            filename,
+            read_options=pacsv.ReadOptions(block_size=chunksize),
+            parse_options=pacsv.ParseOptions(),
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types,
+                strings_can_be_null=True
+            )
+        )
+    
     def clean_data(self, df):
         """Clean and preprocess the property data"""
+        return self.fit(df).transform(df)
+    
+    def fit(self, df):
+        """Record the medians and modes used to fill missing values"""
+        stats = {}
+        
+        # Bedroom/bathroom medians
+        for col in ['Bedrooms', 'Bathrooms']:
+            if col in df.columns:
+                stats[f'{col}_median'] = _nanmedian(df[col])
+        
+        # Size medians per bedroom count (after bedrooms are filled), then overall
+        if 'Size' in df.columns:
+            sizes = _parse_sizes(df['Size'])
+            if 'Bedrooms' in df.columns:
+                bedrooms = df['Bedrooms'].fillna(stats['Bedrooms_median'])
+                by_bedrooms = sizes.groupby(bedrooms, sort=False, observed=True).median()
+                stats['Size_median_by_bedrooms'] = by_bedrooms.dropna().to_dict()
+                sizes = sizes.fillna(bedrooms.map(stats['Size_median_by_bedrooms']))
+            stats['Size_median'] = _nanmedian(sizes)
+        
+        # City/type modes
+        for col in ['City', 'Type']:
+            if col in df.columns:
+                mode = df[col].mode()
+                stats[f'{col}_mode'] = mode.iloc[0] if not mode.empty else 'Unknown'
+        
+        self.stats_ = stats
+        return self
+    
+    def transform(self, df):
+        """Clean and preprocess property data using the statistics recorded by fit"""
         print("Starting data cleaning process...")
         
-        # Make a copy to avoid modifying original
-        cleaned_df = df.copy()
+        # Shallow copy to avoid modifying original; with copy-on-write only
+        # the columns that get rewritten below are ever duplicated
+        cleaned_df = df.copy(deep=False)
         
         # Basic info about the dataset
         print(f"Initial shape: {cleaned_df.shape}")
         print(f"Missing values per column:\n{cleaned_df.isnull().sum()}")
         
+        # Clean size column first so missing sizes are filled with numeric medians
+        if 'Size' in cleaned_df.columns:
+            cleaned_df['Size'] = self._clean_size_column(cleaned_df['Size'])
+        
         # Handle missing values
         cleaned_df = self._handle_missing_values(cleaned_df)
         
@@ -44,9 +304,11 @@ class PropertyDataCleaner:
         if 'Price' in cleaned_df.columns:
             cleaned_df['Price'] = self._clean_price_column(cleaned_df['Price'])
         
-        # Clean size column
-        if 'Size' in cleaned_df.columns:
-            cleaned_df['Size'] = self._clean_size_column(cleaned_df['Size'])
+        # Shrink numeric columns before the remaining passes over the frame
+        cleaned_df = self._downcast_numeric(cleaned_df)
+        
+        # Drop unrealistic prices/sizes and invalid coordinates in one pass
+        cleaned_df = self._validate_ranges(cleaned_df)
         
         # Standardize city names
         if 'City' in cleaned_df.columns:
@@ -56,13 +318,9 @@ class PropertyDataCleaner:
         if 'Type' in cleaned_df.columns:
             cleaned_df['Type'] = self._standardize_property_types(cleaned_df['Type'])
         
-        # Validate coordinates
-        if 'Latitude' in cleaned_df.columns and 'Longitude' in cleaned_df.columns:
-            cleaned_df = self._validate_coordinates(cleaned_df)
-        
         # Remove duplicates
         initial_count = len(cleaned_df)
-        cleaned_df = cleaned_df.drop_duplicates()
+        cleaned_df = self._drop_duplicates(cleaned_df)
         removed_duplicates = initial_count - len(cleaned_df)
         if removed_duplicates > 0:
             print(f"Removed {removed_duplicates} duplicate rows")
@@ -70,37 +328,120 @@ class PropertyDataCleaner:
         print(f"Final shape after cleaning: {cleaned_df.shape}")
         return cleaned_df
     
+    def clean_data_polars(self, path):
+        """Clean property data straight from a CSV file with a lazy Polars query"""
+        if pl is None:
+            print("Polars not installed, falling back to pandas cleaning")
+            return self.clean_data(self.load_raw_data(path))
+        
+        print("Starting lazy Polars cleaning process...")
+        
+        lat_min, lat_max = LAT_RANGE
+        lon_min, lon_max = LON_RANGE
+        price_min, price_max = PRICE_RANGE
+        size_min, size_max = SIZE_RANGE
+        
+        # Read Price/Size as text so unit suffixes never break type inference, and
+        # the numeric columns as floats since schema inference only samples 100 rows
+        lf = pl.scan_csv(path, schema_overrides={
+            'Price': pl.String,
+            'Size': pl.String,
+            'Bedrooms': pl.Float64,
+            'Bathrooms': pl.Float64,
+            'Latitude': pl.Float64,
+            'Longitude': pl.Float64
+        })
+        
+        # Clean price, size, city and type columns
+        price_parts = pl.col('Price').str.to_lowercase()
+        lf = lf.with_columns(
+            pl.when(price_parts.str.extract(PRICE_PATTERN.pattern, 2).is_null())
+            .then(
+                price_parts.str.extract(PRICE_PATTERN.pattern, 1)
+                .str.replace_all(',', '', literal=True)
+                .cast(pl.Float64, strict=False)
+                * price_parts.str.extract(PRICE_PATTERN.pattern, 3)
+                .replace_strict(PRICE_UNITS, default=1, return_dtype=pl.Float64)
+            ).alias('Price'),
+            pl.col('Size').str.replace_all('(?i)' + SIZE_UNIT_PATTERN.pattern, '')
+            .str.strip_chars().cast(pl.Float64, strict=False),
+            pl.col('City').str.strip_chars().str.to_titlecase().replace(CITY_MAPPINGS),
+            pl.col('Type').str.strip_chars().str.to_titlecase().replace(TYPE_MAPPINGS)
+        )
+        
+        # Handle missing values
+        lf = lf.with_columns(
+            pl.col('Bedrooms').fill_null(pl.col('Bedrooms').median()),
+            pl.col('Bathrooms').fill_null(pl.col('Bathrooms').median()),
+            pl.col('City').fill_null(pl.col('City').drop_nulls().mode().first()),
+            pl.col('Type').fill_null(pl.col('Type').drop_nulls().mode().first())
+        ).with_columns(
+            pl.col('Size')
+            .fill_null(pl.col('Size').median().over('Bedrooms'))
+            .fill_null(pl.col('Size').median()),
+            pl.col('City').cast(pl.Categorical),
+            pl.col('Type').cast(pl.Categorical)
+        )
+        
+        # Validate prices, sizes and coordinates, then remove duplicates
+        lf = lf.filter(
+            pl.col('Price').is_between(price_min, price_max)
+            & pl.col('Size').is_between(size_min, size_max)
+            & pl.col('Latitude').is_between(lat_min, lat_max)
+            & pl.col('Longitude').is_between(lon_min, lon_max)
+        ).unique()
+        
+        cleaned_df = lf.collect(engine='streaming').to_pandas()
+        print(f"Final shape after cleaning: {cleaned_df.shape}")
+        return cleaned_df
+    
+    def _downcast_numeric(self, df):
+        """Downcast numeric columns to the smallest dtype that holds their values"""
+        # Counts fit in int8 once missing values are filled; sizes fit in a
+        # small int unless they are fractional. Price keeps float64 precision.
+        for col in ['Bedrooms', 'Bathrooms', 'Size']:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+        
+        for col in ['Latitude', 'Longitude']:
+            if col in df.columns:
+                df[col] = df[col].astype(np.float32)
+        
+        return df
+    
+    def _drop_duplicates(self, df):
+        """Drop duplicate rows by hashing each column once instead of hashing row tuples"""
+        row_hashes = pd.util.hash_pandas_object(df, index=False)
+        return df[~row_hashes.duplicated().to_numpy()]
+    
     def _handle_missing_values(self, df):
-        """Handle missing values in the dataset"""
+        """Handle missing values in the dataset using the fitted statistics"""
         print("Handling missing values...")
         
         # Fill missing bedrooms/bathrooms with median
         numeric_columns = ['Bedrooms', 'Bathrooms']
         for col in numeric_columns:
             if col in df.columns:
-                median_val = df[col].median()
-                df[col].fillna(median_val, inplace=True)
+                median_val = self.stats_[f'{col}_median']
+                df[col] = df[col].fillna(median_val)
                 print(f"Filled {col} missing values with median: {median_val}")
         
         # Fill missing size with median based on bedrooms
         if 'Size' in df.columns and 'Bedrooms' in df.columns:
-            for bedrooms in df['Bedrooms'].unique():
-                if not pd.isna(bedrooms):
-                    mask = (df['Bedrooms'] == bedrooms) & df['Size'].isna()
-                    if mask.any():
-                        median_size = df[df['Bedrooms'] == bedrooms]['Size'].median()
-                        df.loc[mask, 'Size'] = median_size
+            df['Size'] = df['Size'].fillna(df['Bedrooms'].map(self.stats_['Size_median_by_bedrooms']))
         
         # Fill remaining missing sizes with overall median
         if 'Size' in df.columns:
-            df['Size'].fillna(df['Size'].median(), inplace=True)
+            df['Size'] = df['Size'].fillna(self.stats_['Size_median'])
         
         # Fill missing categorical values with mode
         categorical_columns = ['City', 'Type']
         for col in categorical_columns:
             if col in df.columns:
-                mode_val = df[col].mode().iloc[0] if not df[col].mode().empty else 'Unknown'
-                df[col].fillna(mode_val, inplace=True)
+                mode_val = self.stats_[f'{col}_mode']
+                if isinstance(df[col].dtype, pd.CategoricalDtype) and mode_val not in df[col].cat.categories:
+                    df[col] = df[col].cat.add_categories([mode_val])
+                df[col] = df[col].fillna(mode_val)
                 print(f"Filled {col} missing values with mode: {mode_val}")
         
         # Drop rows with missing essential information
@@ -119,28 +460,30 @@ class PropertyDataCleaner:
         """Clean price column by removing currency symbols and converting to numeric"""
         print("Cleaning price column...")
         
-        # Convert to string and handle various formats
-        prices = price_series.astype(str)
-        
-        # Remove currency symbols and commas
-        prices = prices.str.replace('₹', '', regex=False)
-        prices = prices.str.replace('Rs', '', regex=False)
-        prices = prices.str.replace(',', '', regex=False)
-        prices = prices.str.replace(' ', '', regex=False)
-        
-        # Handle 'Crore' and 'Lakh' conversions
-        crore_mask = prices.str.contains('Crore|crore', na=False)
-        lakh_mask = prices.str.contains('Lakh|lakh', na=False)
-        
-        prices.loc[crore_mask] = prices.loc[crore_mask].str.replace('Crore|crore', '', regex=True).astype(float) * 10000000
-        prices.loc[lakh_mask] = prices.loc[lakh_mask].str.replace('Lakh|lakh', '', regex=True).astype(float) * 100000
-        
-        # Convert remaining to numeric
-        prices = pd.to_numeric(prices, errors='coerce')
-        
-        # Remove unrealistic prices (too low or too high)
-        valid_prices = prices[(prices >= 100000) & (prices <= 1000000000)]
-        print(f"Price range: {valid_prices.min():,.0f} to {valid_prices.max():,.0f}")
+        # Already-numeric columns need no string parsing
+        if pd.api.types.is_numeric_dtype(price_series):
+            return price_series.astype(np.float64)
+        
+        if parse_prices is not None:
+            # Native single pass over each string, including Crore/Lakh units
+            prices = np.empty(len(price_series))
+            parse_prices(price_series.astype(str).tolist(), prices)
+            prices = pd.Series(prices, index=price_series.index)
+        else:
+            # Pull the number and optional unit out of each value in one pass,
+            # skipping currency symbols and spaces
+            parts = price_series.astype('string').str.extract(PRICE_PATTERN, expand=True)
+            numbers = pd.to_numeric(parts[0].str.replace(',', '', regex=False), errors='coerce')
+            numbers = numbers.to_numpy(dtype=np.float64, na_value=np.nan)
+            numbers[parts[1].notna().to_numpy(dtype=bool)] = np.nan
+            
+            # Handle 'Crore' and 'Lakh' conversions
+            units = parts[2].str.lower()
+            crore = units.eq('crore').fillna(False).to_numpy(dtype=bool)
+            lakh = units.eq('lakh').fillna(False).to_numpy(dtype=bool)
+            prices = np.where(crore, numbers * PRICE_UNITS['crore'],
+                              np.where(lakh, numbers * PRICE_UNITS['lakh'], numbers))
+            prices = pd.Series(prices, index=price_series.index)
         
         return prices
     
@@ -148,84 +491,57 @@ class PropertyDataCleaner:
         """Clean size column and convert to numeric (square feet)"""
         print("Cleaning size column...")
         
-        sizes = size_series.astype(str)
-        
-        # Remove common suffixes
-        sizes = sizes.str.replace('sq ft|sqft|sq.ft|sq feet|square feet', '', regex=True)
-        sizes = sizes.str.replace(' ', '', regex=False)
-        
-        # Convert to numeric
-        sizes = pd.to_numeric(sizes, errors='coerce')
-        
-        # Remove unrealistic sizes
-        valid_sizes = sizes[(sizes >= 200) & (sizes <= 10000)]
-        print(f"Size range: {valid_sizes.min():.0f} to {valid_sizes.max():.0f} sq ft")
-        
-        return sizes
+        return _parse_sizes(size_series)
     
     def _standardize_city_names(self, city_series):
         """Standardize city names"""
         print("Standardizing city names...")
         
         cities = city_series.str.strip().str.title()
-        
-        # Common city name mappings
-        city_mappings = {
-            'Bombay': 'Mumbai',
-            'Bangalore': 'Bengaluru',
-            'Calcutta': 'Kolkata',
-            'Madras': 'Chennai',
-            'New Delhi': 'Delhi',
-            'Gurgaon': 'Gurugram'
-        }
-        
-        for old_name, new_name in city_mappings.items():
-            cities = cities.str.replace(old_name, new_name, regex=False)
+        cities = cities.map(CITY_MAPPINGS).fillna(cities)
         
         print(f"Unique cities: {cities.nunique()}")
         print(f"Top 10 cities: {cities.value_counts().head(10).to_dict()}")
         
-        return cities
+        return cities.astype('category')
     
     def _standardize_property_types(self, type_series):
         """Standardize property types"""
         print("Standardizing property types...")
         
         types = type_series.str.strip().str.title()
-        
-        # Common property type mappings
-        type_mappings = {
-            'Flat': 'Apartment',
-            'Builder Floor': 'Apartment',
-            'Independent House': 'House',
-            'Villa': 'House',
-            'Plot': 'Land'
-        }
-        
-        for old_type, new_type in type_mappings.items():
-            types = types.str.replace(old_type, new_type, regex=False)
+        types = types.map(TYPE_MAPPINGS).fillna(types)
         
         print(f"Property types: {types.value_counts().to_dict()}")
         
-        return types
+        return types.astype('category')
     
-    def _validate_coordinates(self, df):
-        """Validate latitude and longitude coordinates"""
-        print("Validating coordinates...")
-        
-        # India coordinate bounds (approximate)
-        lat_min, lat_max = 8.0, 37.0
-        lon_min, lon_max = 68.0, 97.0
+    def _validate_ranges(self, df):
+        """Drop rows with unrealistic prices/sizes or coordinates outside India"""
+        print("Validating prices, sizes and coordinates...")
+        
+        column_ranges = {
+            'Price': PRICE_RANGE,
+            'Size': SIZE_RANGE,
+            'Latitude': LAT_RANGE,
+            'Longitude': LON_RANGE
+        }
         
-        valid_coords = (
-            (df['Latitude'] >= lat_min) & (df['Latitude'] <= lat_max) &
-            (df['Longitude'] >= lon_min) & (df['Longitude'] <= lon_max)
-        )
+        # Compare on the raw arrays and fuse all bounds into one mask;
+        # missing values fail every check
+        checks = []
+        for col, (low, high) in column_ranges.items():
+            if col in df.columns:
+                values = df[col].to_numpy()
+                checks += [values >= low, values <= high]
+        if not checks:
+            return df
+        valid_rows = np.logical_and.reduce(checks)
         
-        invalid_count = len(df) - valid_coords.sum()
+        invalid_count = len(df) - int(valid_rows.sum())
         if invalid_count > 0:
-            print(f"Found {invalid_count} properties with invalid coordinates")
-            df = df[valid_coords]
+            print(f"Removed {invalid_count} properties with out-of-range price, size or coordinates")
+            df = df.iloc[valid_rows]
         
         return df
     
@@ -233,36 +549,57 @@ class PropertyDataCleaner:
         """Add derived features for ML"""
         print("Adding derived features...")
         
-        # Price per square foot
-        if 'Price' in df.columns and 'Size' in df.columns:
-            df['Price_per_sqft'] = df['Price'] / df['Size']
-        
-        # Bathroom to bedroom ratio
-        if 'Bathrooms' in df.columns and 'Bedrooms' in df.columns:
-            df['Bath_Bed_Ratio'] = df['Bathrooms'] / df['Bedrooms'].replace(0, 1)
+        # Price per square foot and bathroom to bedroom ratio
+        if {'Price', 'Size', 'Bathrooms', 'Bedrooms'}.issubset(df.columns):
+            n = len(df)
+            pps_out = np.empty(n)
+            ratio_out = np.empty(n)
+            _derive_features(df['Price'].to_numpy(dtype=np.float64),
+                             df['Size'].to_numpy(dtype=np.float64),
+                             df['Bedrooms'].to_numpy(dtype=np.float64),
+                             df['Bathrooms'].to_numpy(dtype=np.float64),
+                             pps_out, ratio_out)
+            df['Price_per_sqft'] = pps_out
+            df['Bath_Bed_Ratio'] = ratio_out
+        else:
+            if 'Price' in df.columns and 'Size' in df.columns:
+                df['Price_per_sqft'] = df['Price'] / df['Size']
+            
+            if 'Bathrooms' in df.columns and 'Bedrooms' in df.columns:
+                df['Bath_Bed_Ratio'] = df['Bathrooms'] / df['Bedrooms'].replace(0, 1)
         
         # Size category
         if 'Size' in df.columns:
-            df['Size_Category'] = pd.cut(df['Size'], 
-                                       bins=[0, 500, 1000, 2000, float('inf')],
-                                       labels=['Small', 'Medium', 'Large', 'XLarge'])
+            sizes = df['Size'].to_numpy(dtype=float)
+            codes = np.digitize(sizes, [500, 1000, 2000], right=True)
+            codes[np.isnan(sizes) | (sizes <= 0)] = -1
+            df['Size_Category'] = pd.Categorical.from_codes(
+                codes, ['Small', 'Medium', 'Large', 'XLarge'], ordered=True)
         
         # Price category
         if 'Price' in df.columns:
-            df['Price_Category'] = pd.qcut(df['Price'], 
-                                         q=4, 
-                                         labels=['Budget', 'Mid-Range', 'Premium', 'Luxury'])
+            prices = df['Price'].to_numpy(dtype=float)
+            quartiles = np.nanquantile(prices, [0.25, 0.5, 0.75])
+            codes = np.digitize(prices, quartiles, right=True)
+            codes[np.isnan(prices)] = -1
+            df['Price_Category'] = pd.Categorical.from_codes(
+                codes, ['Budget', 'Mid-Range', 'Premium', 'Luxury'], ordered=True)
         
         print(f"Added {4} derived features")
         return df
     
     def save_cleaned_data(self, df, output_filename):
-        """Save cleaned data to CSV"""
+        """Save cleaned data to CSV, or to Parquet if the filename ends in .parquet"""
         try:
             # Ensure output directory exists
             os.makedirs(os.path.dirname(output_filename), exist_ok=True)
             
-            df.to_csv(output_filename, index=False)
+            if output_filename.endswith('.parquet'):
+                df.to_parquet(output_filename, engine='pyarrow', compression='zstd', index=False)
+            elif pl is not None:
+                pl.from_pandas(df).write_csv(output_filename)
+            else:
+                df.to_csv(output_filename, index=False)
             print(f"Cleaned data saved to {output_filename}")
             print(f"Final dataset shape: {df.shape}")
             return True
@@ -274,6 +611,12 @@ class PropertyDataCleaner:
         """Generate a summary report of the cleaned data"""
         report_filename = os.path.join(output_dir, 'data_summary_report.txt')
         
+        # Compute every summary up front, one scan each
+        null_counts = df.isnull().sum()
+        stats = df.describe()
+        city_counts = df['City'].value_counts().head(10) if 'City' in df.columns else None
+        type_counts = df['Type'].value_counts() if 'Type' in df.columns else None
+        
         with open(report_filename, 'w') as f:
             f.write("PROPERTY DATA CLEANING SUMMARY REPORT\n")
             f.write("=" * 50 + "\n\n")
@@ -283,28 +626,47 @@ class PropertyDataCleaner:
             
             f.write("COLUMN INFORMATION:\n")
             f.write("-" * 20 + "\n")
-            f.write(f"{df.info(buf=f)}\n\n")
+            df.info(buf=f)
+            f.write("\n")
             
             f.write("MISSING VALUES:\n")
             f.write("-" * 15 + "\n")
-            f.write(f"{df.isnull().sum()}\n\n")
+            f.write(null_counts.to_string() + "\n\n")
             
             f.write("NUMERICAL STATISTICS:\n")
             f.write("-" * 22 + "\n")
-            f.write(f"{df.describe()}\n\n")
+            f.write(stats.to_string() + "\n\n")
             
-            if 'City' in df.columns:
+            if city_counts is not None:
                 f.write("TOP 10 CITIES:\n")
                 f.write("-" * 14 + "\n")
-                f.write(f"{df['City'].value_counts().head(10)}\n\n")
+                f.write(city_counts.to_string() + "\n\n")
             
-            if 'Type' in df.columns:
+            if type_counts is not None:
                 f.write("PROPERTY TYPES:\n")
                 f.write("-" * 15 + "\n")
-                f.write(f"{df['Type'].value_counts()}\n\n")
+                f.write(type_counts.to_string() + "\n\n")
         
         print(f"Summary report saved to {report_filename}")
 
+def _clean_csv_range(path, header, start, end, stats):
+    """Load and clean one byte range of a CSV file; runs in a worker process"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    
+    cleaner = PropertyDataCleaner()
+    cleaner.stats_ = stats
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = cleaner.load_raw_data(io.BytesIO(header + data))
+        return cleaner.transform(df)
+
+def _arrow_types_mapper(arrow_type):
+    """Keep plain string columns Arrow-backed when converting to pandas"""
+    if arrow_type in (pa.string(), pa.large_string()):
+        return pd.StringDtype('pyarrow')
+    return None
+
 def main():
     """Main function to run data cleaning process"""
     
@@ -345,33 +707,48 @@ def create_sample_dataset(filename):
     """Create a sample dataset for testing"""
     print("Creating sample property dataset...")
     
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_properties = 1000
     
     cities = ['Mumbai', 'Delhi', 'Bengaluru', 'Chennai', 'Kolkata', 'Hyderabad', 'Pune', 'Ahmedabad']
     property_types = ['Apartment', 'House', 'Villa', 'Studio']
+    amenities = ['Gym,Pool', 'Parking', 'Garden', 'Security', 'Gym']
+    
+    # String columns are drawn as small integer codes into these tables
+    string_tables = {'City': cities, 'Type': property_types, 'Amenities': amenities}
     
     # Generate sample data
     data = {
-        'ID': range(1, n_properties + 1),
-        'City': np.random.choice(cities, n_properties),
-        'Price': np.random.lognormal(15, 0.5, n_properties).astype(int),
-        'Bedrooms': np.random.choice([1, 2, 3, 4, 5], n_properties, p=[0.1, 0.3, 0.4, 0.15, 0.05]),
-        'Bathrooms': np.random.randint(1, 4, n_properties),
-        'Size': np.random.normal(1200, 400, n_properties).astype(int),
-        'Type': np.random.choice(property_types, n_properties),
-        'Latitude': np.random.uniform(8.0, 35.0, n_properties),
-        'Longitude': np.random.uniform(68.0, 97.0, n_properties),
-        'Amenities': np.random.choice(['Gym,Pool', 'Parking', 'Garden', 'Security', 'Gym'], n_properties)
+        'ID': np.arange(1, n_properties + 1),
+        'City': rng.integers(0, len(cities), n_properties, dtype=np.int8),
+        'Price': rng.lognormal(15, 0.5, n_properties).astype(int),
+        'Bedrooms': rng.choice([1, 2, 3, 4, 5], n_properties, p=[0.1, 0.3, 0.4, 0.15, 0.05]),
+        'Bathrooms': rng.integers(1, 4, n_properties),
+        'Size': rng.normal(1200, 400, n_properties).astype(int),
+        'Type': rng.integers(0, len(property_types), n_properties, dtype=np.int8),
+        'Latitude': rng.uniform(8.0, 35.0, n_properties),
+        'Longitude': rng.uniform(68.0, 97.0, n_properties),
+        'Amenities': rng.integers(0, len(amenities), n_properties, dtype=np.int8)
     }
     
-    # Create DataFrame and save
-    df = pd.DataFrame(data)
-    
     # Ensure directory exists
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     
-    df.to_csv(filename, index=False)
+    # Write the arrays straight to CSV without an intermediate DataFrame
+    if pa is not None:
+        table = pa.table({
+            col: pa.DictionaryArray.from_arrays(values, pa.array(string_tables[col]))
+            if col in string_tables else pa.array(values)
+            for col, values in data.items()
+        })
+        pacsv.write_csv(table, filename,
+                        write_options=pacsv.WriteOptions(include_header=True, batch_size=65536))
+    else:
+        pd.DataFrame({
+            col: pd.Categorical.from_codes(values, string_tables[col])
+            if col in string_tables else values
+            for col, values in data.items()
+        }).to_csv(filename, index=False)
     print(f"Sample dataset created: {filename}")
     print(f"Generated {n_properties} sample properties")
 
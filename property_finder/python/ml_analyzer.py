@@ -7,18 +7,169 @@ and provides insights for C++ implementation.
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.linear_model import LinearRegression, Ridge, Lasso
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
+from sklearn.preprocessing import StandardScaler
+from sklearn.base import clone
+import argparse
+import gc
+import hashlib
+import json
 import joblib
+from joblib import Parallel, delayed
 import os
+import pickle
+import shutil
+import tempfile
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import lz4
+except ImportError:
+    lz4 = None
+
+# Column dtypes pushed down into the pandas CSV reader
+LOAD_DTYPES = {
+    'City': 'category',
+    'Type': 'category',
+    'Bedrooms': 'float32',
+    'Bathrooms': 'float32',
+    'Size': 'float32',
+    'Latitude': 'float32',
+    'Longitude': 'float32'
+}
+
+# Saved model compression: fast LZ4 when installed, zlib otherwise
+MODEL_COMPRESSION = ('lz4', 3) if lz4 is not None else ('zlib', 3)
+
+# Raw columns used as model features
+FEATURE_COLUMNS = ['City', 'Type', 'Bedrooms', 'Bathrooms', 'Size', 'Latitude', 'Longitude']
+
+# Prepared feature matrices, keyed by the source CSV's mtime and size, the feature
+# columns and a format version; bump the version when encoding or scaling changes
+FEATURE_CACHE_DIR = '../data/cache'
+FEATURE_CACHE_VERSION = 1
+
+# Cross-validation folds, and models whose low variance makes CV redundant
+CV_FOLDS = 3
+SKIP_CV_FOR = {'Linear Regression'}
+
+# Tree ensembles that dominate training time; only these get worker processes,
+# the linear models finish in milliseconds and are fitted inline
+PARALLEL_MODELS = {'Random Forest', 'Hist Gradient Boosting'}
+
+
+def _physical_cores():
+    """Number of physical CPU cores, falling back to logical cores"""
+    cores = psutil.cpu_count(logical=False) if psutil is not None else None
+    return cores or os.cpu_count() or 1
+
+
+def _median_by_group(keys, values):
+    """Per-group medians of values from a single sort on the integer group keys"""
+    keep = ~np.isnan(values)
+    keys, values = keys[keep], values[keep]
+    order = np.argsort(keys, kind='stable')
+    keys, values = keys[order], values[order]
+    groups, starts = np.unique(keys, return_index=True)
+    medians = np.array([np.median(segment) for segment in np.split(values, starts[1:])])
+    return groups, medians
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _fast_residual_stats(y, y_pred):
+        """SSE, SAE and total sum of squares in one fused pass over the residuals"""
+        y_mean = y.mean()
+        sse = 0.0
+        sae = 0.0
+        tss = 0.0
+        for i in prange(len(y)):
+            r = y[i] - y_pred[i]
+            sse += r * r
+            sae += abs(r)
+            d = y[i] - y_mean
+            tss += d * d
+        return sse, sae, tss
+else:
+    def _fast_residual_stats(y, y_pred):
+        """SSE, SAE and total sum of squares with NumPy reductions"""
+        residuals = y - y_pred
+        centered = y - y.mean()
+        return residuals @ residuals, np.abs(residuals).sum(), centered @ centered
+
+
+def _fast_metrics(y, y_pred):
+    """R², MAE and RMSE from a single residual pass"""
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    y_pred = np.ascontiguousarray(y_pred, dtype=np.float64)
+    sse, sae, tss = (np.float64(stat) for stat in _fast_residual_stats(y, y_pred))
+    n = len(y)
+    if tss == 0:
+        # Constant target: same convention as sklearn's r2_score
+        r2 = 1.0 if sse == 0 else 0.0
+    else:
+        r2 = 1 - sse / tss
+    mae = sae / n
+    rmse = np.sqrt(sse / n)
+    return r2, mae, rmse
+
+
+def _fit_and_score(name, model, X_train_path, y_train, X_test, y_test, n_threads=1):
+    """Fit one model and return its metrics row together with the fitted model"""
+    # Training matrix is shared between workers through the page cache
+    X_train = np.load(X_train_path, mmap_mode='r')
+    
+    # Train model
+    model.fit(X_train, y_train)
+    
+    # Predictions
+    y_pred_train = model.predict(X_train)
+    y_pred_test = model.predict(X_test)
+    
+    # Metrics
+    train_r2, train_mae, train_rmse = _fast_metrics(y_train, y_pred_train)
+    test_r2, test_mae, test_rmse = _fast_metrics(y_test, y_pred_test)
+    
+    # Cross-validation
+    if name in SKIP_CV_FOR:
+        cv_mean, cv_std = test_r2, 0.0
+    else:
+        cv_scores = cross_val_score(model, X_train, y_train, cv=CV_FOLDS, scoring='r2',
+                                    n_jobs=n_threads)
+        cv_mean, cv_std = cv_scores.mean(), cv_scores.std()
+    
+    result = {
+        'Model': name,
+        'Train R²': train_r2,
+        'Test R²': test_r2,
+        'Train MAE': train_mae,
+        'Test MAE': test_mae,
+        'Train RMSE': train_rmse,
+        'Test RMSE': test_rmse,
+        'CV R² Mean': cv_mean,
+        'CV R² Std': cv_std
+    }
+    
+    return result, model
+
 class PropertyMLAnalyzer:
     def __init__(self):
         self.models = {}
@@ -26,12 +177,29 @@ class PropertyMLAnalyzer:
         self.encoders = {}
         self.feature_columns = []
         self.target_column = 'Price'
+        self._numeric_cols = None
+        self._n_properties = 0
         
     def load_data(self, filename):
         """Load cleaned property data"""
         try:
             print(f"Loading data from {filename}...")
-            self.df = pd.read_csv(filename)
+            if pl is not None:
+                # Parse in parallel with Polars; plain NumPy-backed columns keep
+                # matplotlib/seaborn and scikit-learn happy downstream
+                polars_dtypes = {
+                    'City': pl.Categorical,
+                    'Type': pl.Categorical,
+                    'Bedrooms': pl.Float32,
+                    'Bathrooms': pl.Float32,
+                    'Size': pl.Float32,
+                    'Latitude': pl.Float32,
+                    'Longitude': pl.Float32
+                }
+                self.df = pl.read_csv(filename, schema_overrides=polars_dtypes).to_pandas()
+            else:
+                self.df = pd.read_csv(filename, engine='pyarrow', dtype=LOAD_DTYPES)
+            self._shrink_dtypes()
             print(f"Loaded {len(self.df)} properties with {len(self.df.columns)} columns")
             print(f"Columns: {list(self.df.columns)}")
             return True
@@ -39,6 +207,28 @@ class PropertyMLAnalyzer:
             print(f"Error loading data: {e}")
             return False
     
+    def _shrink_dtypes(self):
+        """Downcast numeric columns and turn low-cardinality text columns into categoricals"""
+        for col in self.df.columns:
+            # Keep full precision on the prediction target
+            if col == self.target_column:
+                continue
+            
+            kind = self.df[col].dtype.kind
+            if kind in 'iu':
+                self.df[col] = pd.to_numeric(self.df[col], downcast='integer')
+            elif kind == 'f':
+                # Whole-number floats (e.g. room counts) become integers; imputed
+                # fractional medians or missing values keep them float
+                shrunk = pd.to_numeric(self.df[col], downcast='integer')
+                if shrunk.dtype.kind == 'f':
+                    shrunk = pd.to_numeric(shrunk, downcast='float')
+                self.df[col] = shrunk
+            elif kind == 'O' and self.df[col].nunique() / max(len(self.df), 1) < 0.5:
+                self.df[col] = self.df[col].astype('category')
+        
+        self._numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+    
     def explore_data(self, save_plots=True):
         """Perform exploratory data analysis"""
         print("\n=== EXPLORATORY DATA ANALYSIS ===")
@@ -60,84 +250,93 @@ class PropertyMLAnalyzer:
     
     def _create_eda_plots(self):
         """Create EDA visualizations"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         os.makedirs('../docs/plots', exist_ok=True)
         
         # Set style
         plt.style.use('seaborn-v0_8')
         sns.set_palette("husl")
         
-        # 1. Price distribution
-        plt.figure(figsize=(12, 8))
-        
-        plt.subplot(2, 2, 1)
-        plt.hist(self.df[self.target_column], bins=50, alpha=0.7, edgecolor='black')
-        plt.title('Price Distribution')
-        plt.xlabel('Price (₹)')
-        plt.ylabel('Frequency')
+        # All EDA panels share one figure and one render
+        fig, axes = plt.subplot_mosaic(
+            [['price', 'log_price', 'type_share'],
+             ['city', 'bedrooms', 'type_price'],
+             ['corr', 'corr', 'corr']],
+            figsize=(18, 20), gridspec_kw={'height_ratios': [1, 1, 1.6]},
+            constrained_layout=True
+        )
         
-        plt.subplot(2, 2, 2)
-        plt.hist(np.log(self.df[self.target_column]), bins=50, alpha=0.7, edgecolor='black')
-        plt.title('Log Price Distribution')
-        plt.xlabel('Log(Price)')
-        plt.ylabel('Frequency')
+        # 1. Price distribution
+        ax = axes['price']
+        ax.hist(self.df[self.target_column], bins=50, alpha=0.7, edgecolor='black')
+        ax.set_title('Price Distribution')
+        ax.set_xlabel('Price (₹)')
+        ax.set_ylabel('Frequency')
+        
+        ax = axes['log_price']
+        ax.hist(np.log(self.df[self.target_column]), bins=50, alpha=0.7, edgecolor='black')
+        ax.set_title('Log Price Distribution')
+        ax.set_xlabel('Log(Price)')
+        ax.set_ylabel('Frequency')
         
         # 3. City-wise price analysis
-        plt.subplot(2, 2, 3)
-        city_prices = self.df.groupby('City')[self.target_column].median().sort_values(ascending=False)
-        city_prices.head(10).plot(kind='bar')
-        plt.title('Median Price by City (Top 10)')
-        plt.xlabel('City')
-        plt.ylabel('Median Price (₹)')
-        plt.xticks(rotation=45)
+        ax = axes['city']
+        prices = self.df[self.target_column].to_numpy(dtype=np.float64)
+        city = self.df['City'].astype('category').cat
+        city_codes = city.codes.to_numpy()
+        known = city_codes >= 0
+        codes, medians = _median_by_group(city_codes[known], prices[known])
+        city_prices = pd.Series(medians, index=city.categories[codes]).sort_values(ascending=False)
+        city_prices.head(10).plot(kind='bar', ax=ax)
+        ax.set_title('Median Price by City (Top 10)')
+        ax.set_xlabel('City')
+        ax.set_ylabel('Median Price (₹)')
+        ax.tick_params(axis='x', rotation=45)
         
         # 4. Bedrooms vs Price
-        plt.subplot(2, 2, 4)
-        bedroom_prices = self.df.groupby('Bedrooms')[self.target_column].median()
-        bedroom_prices.plot(kind='bar')
-        plt.title('Median Price by Bedrooms')
-        plt.xlabel('Bedrooms')
-        plt.ylabel('Median Price (₹)')
+        ax = axes['bedrooms']
+        bedrooms, medians = _median_by_group(self.df['Bedrooms'].to_numpy(), prices)
+        bedroom_prices = pd.Series(medians, index=bedrooms)
+        bedroom_prices.plot(kind='bar', ax=ax)
+        ax.set_title('Median Price by Bedrooms')
+        ax.set_xlabel('Bedrooms')
+        ax.set_ylabel('Median Price (₹)')
         
-        plt.tight_layout()
-        plt.savefig('../docs/plots/price_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        # Property type distribution
+        ax = axes['type_share']
+        self.df['Type'].value_counts().plot(kind='pie', autopct='%1.1f%%', ax=ax)
+        ax.set_title('Property Type Distribution')
+        
+        ax = axes['type_price']
+        sns.boxplot(data=self.df, x='Type', y=self.target_column, ax=ax)
+        ax.set_title('Price Distribution by Property Type')
+        ax.tick_params(axis='x', rotation=45)
         
         # Correlation heatmap
-        plt.figure(figsize=(10, 8))
-        numeric_columns = self.df.select_dtypes(include=[np.number]).columns
-        correlation_matrix = self.df[numeric_columns].corr()
+        ax = axes['corr']
+        numeric_columns = self._numeric_cols
+        mat = np.ascontiguousarray(self.df[numeric_columns].to_numpy(dtype=np.float32))
+        mat = mat[~np.isnan(mat).any(axis=1)]
+        correlation_matrix = pd.DataFrame(np.corrcoef(mat, rowvar=False),
+                                          index=numeric_columns, columns=numeric_columns)
         
         sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0,
-                   square=True, fmt='.2f')
-        plt.title('Feature Correlation Matrix')
-        plt.tight_layout()
-        plt.savefig('../docs/plots/correlation_matrix.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        # Property type distribution
-        plt.figure(figsize=(12, 6))
-        
-        plt.subplot(1, 2, 1)
-        self.df['Type'].value_counts().plot(kind='pie', autopct='%1.1f%%')
-        plt.title('Property Type Distribution')
+                   square=True, fmt='.2f', ax=ax)
+        ax.set_title('Feature Correlation Matrix')
         
-        plt.subplot(1, 2, 2)
-        sns.boxplot(data=self.df, x='Type', y=self.target_column)
-        plt.title('Price Distribution by Property Type')
-        plt.xticks(rotation=45)
+        fig.savefig('../docs/plots/eda.png', dpi=150, bbox_inches='tight')
+        plt.close(fig)
         
-        plt.tight_layout()
-        plt.savefig('../docs/plots/property_type_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        print("EDA plots saved to ../docs/plots/")
+        print("EDA plots saved to ../docs/plots/eda.png")
     
     def prepare_features(self):
         """Prepare features for machine learning"""
         print("\n=== FEATURE ENGINEERING ===")
         
         # Identify feature columns
-        self.feature_columns = ['City', 'Type', 'Bedrooms', 'Bathrooms', 'Size', 'Latitude', 'Longitude']
+        self.feature_columns = list(FEATURE_COLUMNS)
         
         # Remove rows with missing target
         self.df = self.df.dropna(subset=[self.target_column])
@@ -151,27 +350,96 @@ class PropertyMLAnalyzer:
         
         for col in categorical_columns:
             if col in X.columns:
-                le = LabelEncoder()
-                X[col] = le.fit_transform(X[col].astype(str))
-                self.encoders[col] = le
-                print(f"Encoded {col}: {len(le.classes_)} categories")
-        
-        # Add derived features
-        if 'Size' in X.columns and 'Bedrooms' in X.columns:
-            X['Size_per_Bedroom'] = X['Size'] / X['Bedrooms'].replace(0, 1)
-        
-        if 'Bathrooms' in X.columns and 'Bedrooms' in X.columns:
-            X['Bath_Bed_Ratio'] = X['Bathrooms'] / X['Bedrooms'].replace(0, 1)
+                # Sorted categories give the same codes LabelEncoder would
+                cat = X[col].astype('category').cat.remove_unused_categories()
+                cat = cat.cat.reorder_categories(cat.cat.categories.sort_values())
+                X[col] = cat.cat.codes.astype(np.int32)
+                self.encoders[col] = cat.cat.categories
+                print(f"Encoded {col}: {len(cat.cat.categories)} categories")
+        
+        # Add derived features (zero bedrooms count as one)
+        if 'Bedrooms' in X.columns:
+            bedrooms = X['Bedrooms'].to_numpy(dtype=np.float32)
+            bedrooms = np.where(bedrooms == 0, np.float32(1), bedrooms)
+            
+            if 'Size' in X.columns:
+                X['Size_per_Bedroom'] = np.divide(X['Size'].to_numpy(dtype=np.float32), bedrooms)
+            
+            if 'Bathrooms' in X.columns:
+                X['Bath_Bed_Ratio'] = np.divide(X['Bathrooms'].to_numpy(dtype=np.float32), bedrooms)
         
         # Scale numerical features
         numerical_columns = X.select_dtypes(include=[np.number]).columns
-        scaler = StandardScaler()
-        X[numerical_columns] = scaler.fit_transform(X[numerical_columns])
+        Xn = np.ascontiguousarray(X[numerical_columns].to_numpy(dtype=np.float32))
+        scaler = StandardScaler(copy=False)
+        scaler.fit_transform(Xn)
+        scaler.mean_ = scaler.mean_.astype(np.float32)
+        scaler.scale_ = scaler.scale_.astype(np.float32)
+        X[numerical_columns] = Xn
         self.scalers['features'] = scaler
         
         print(f"Final feature matrix shape: {X.shape}")
         print(f"Features: {list(X.columns)}")
         
+        self._release_raw_data()
+        return X, y
+    
+    def _release_raw_data(self, n_properties=None):
+        """Drop the loaded frame once X/y exist; only its row count is reported later"""
+        self._n_properties = len(self.df) if n_properties is None else n_properties
+        del self.df
+        gc.collect()
+    
+    def feature_cache_path(self, filename):
+        """Cache file for the features prepared from filename"""
+        key_parts = [str(os.path.getmtime(filename)), str(os.path.getsize(filename)),
+                     ','.join(FEATURE_COLUMNS), f"v{FEATURE_CACHE_VERSION}"]
+        key = hashlib.md5('|'.join(key_parts).encode()).hexdigest()
+        return os.path.join(FEATURE_CACHE_DIR, f"{key}.parquet")
+    
+    def _cache_features(self, X, y, cache_path):
+        """Store the prepared features plus fitted scalers/encoders"""
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        X.assign(_y=y).to_parquet(cache_path)
+        fitted = {'scalers': self.scalers, 'encoders': self.encoders,
+                  'feature_columns': self.feature_columns}
+        joblib.dump(fitted, os.path.splitext(cache_path)[0] + '.joblib')
+        print(f"Cached prepared features to {cache_path}")
+    
+    def _load_cached_features(self, cache_path):
+        """Load prepared features plus fitted scalers/encoders, or None if the entry is unusable"""
+        print(f"\nLoading prepared features from {cache_path}...")
+        try:
+            X = pd.read_parquet(cache_path)
+            y = X.pop('_y').rename(self.target_column)
+            fitted = joblib.load(os.path.splitext(cache_path)[0] + '.joblib')
+            scalers = fitted['scalers']
+            encoders = fitted['encoders']
+            feature_columns = fitted['feature_columns']
+        except Exception as e:
+            print(f"Ignoring incomplete feature cache entry: {e}")
+            return None
+        
+        self.scalers = scalers
+        self.encoders = encoders
+        self.feature_columns = feature_columns
+        
+        print(f"Final feature matrix shape: {X.shape}")
+        
+        # Rows with a missing target were already dropped before caching
+        self._release_raw_data(len(X))
+        return X, y
+    
+    def prepare_features_cached(self, filename):
+        """Prepare features, reusing the cached result for an unchanged input file"""
+        cache_path = self.feature_cache_path(filename)
+        if os.path.exists(cache_path):
+            cached = self._load_cached_features(cache_path)
+            if cached is not None:
+                return cached
+        
+        X, y = self.prepare_features()
+        self._cache_features(X, y, cache_path)
         return X, y
     
     def train_models(self, X, y):
@@ -187,50 +455,63 @@ class PropertyMLAnalyzer:
         models_to_train = {
             'Linear Regression': LinearRegression(),
             'Ridge Regression': Ridge(alpha=1.0),
-            'Lasso Regression': Lasso(alpha=1.0),
-            'Random Forest': RandomForestRegressor(n_estimators=100, random_state=42),
-            'Gradient Boosting': GradientBoostingRegressor(n_estimators=100, random_state=42)
+            'Lasso Regression': Lasso(alpha=1.0, selection='random', max_iter=200, tol=1e-3, random_state=42),
+            'Random Forest': RandomForestRegressor(n_estimators=100, max_depth=16, min_samples_leaf=5,
+                                                   max_features='sqrt', random_state=42),
+            'Hist Gradient Boosting': HistGradientBoostingRegressor(max_iter=100, max_leaf_nodes=31,
+                                                                    learning_rate=0.1, random_state=42)
         }
         
+        # Fit the heavy models in separate processes and split the physical cores
+        # between them, so threaded estimators inside a worker don't oversubscribe
+        cores = _physical_cores()
+        heavy_models = {name: model for name, model in models_to_train.items() if name in PARALLEL_MODELS}
+        n_jobs = max(1, min(len(heavy_models), cores))
+        threads_per_model = max(1, cores // n_jobs)
+        for model in heavy_models.values():
+            if 'n_jobs' in model.get_params():
+                model.set_params(n_jobs=threads_per_model)
+        print(f"Training {len(heavy_models)} ensemble models with {n_jobs} worker processes "
+              f"({threads_per_model} threads each), the rest inline...")
+        
+        # Workers memory-map one on-disk copy of X_train instead of each unpickling their own
+        memmap_dir = tempfile.mkdtemp(prefix='property_ml_')
+        X_train_path = os.path.join(memmap_dir, 'X_train.npy')
+        try:
+            np.save(X_train_path, X_train.to_numpy(dtype=np.float32))
+            train_target = y_train.to_numpy()
+            test_features = X_test.to_numpy(dtype=np.float32)
+            test_target = y_test.to_numpy()
+            
+            fitted = {}
+            for name, model in models_to_train.items():
+                if name not in heavy_models:
+                    fitted[name] = _fit_and_score(name, clone(model), X_train_path, train_target,
+                                                  test_features, test_target, cores)
+            
+            heavy_results = Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(_fit_and_score)(name, clone(model), X_train_path, train_target,
+                                        test_features, test_target, threads_per_model)
+                for name, model in heavy_models.items()
+            )
+            for result, model in heavy_results:
+                fitted[result['Model']] = (result, model)
+        finally:
+            shutil.rmtree(memmap_dir, ignore_errors=True)
+        
+        results_and_models = [fitted[name] for name in models_to_train]
+        
         results = []
         
-        for name, model in models_to_train.items():
-            print(f"\nTraining {name}...")
-            
-            # Train model
-            model.fit(X_train, y_train)
+        for result, model in results_and_models:
+            name = result['Model']
             self.models[name] = model
+            results.append(result)
             
-            # Predictions
-            y_pred_train = model.predict(X_train)
-            y_pred_test = model.predict(X_test)
-            
-            # Metrics
-            train_r2 = r2_score(y_train, y_pred_train)
-            test_r2 = r2_score(y_test, y_pred_test)
-            train_mae = mean_absolute_error(y_train, y_pred_train)
-            test_mae = mean_absolute_error(y_test, y_pred_test)
-            train_rmse = np.sqrt(mean_squared_error(y_train, y_pred_train))
-            test_rmse = np.sqrt(mean_squared_error(y_test, y_pred_test))
-            
-            # Cross-validation
-            cv_scores = cross_val_score(model, X_train, y_train, cv=5, scoring='r2')
-            
-            results.append({
-                'Model': name,
-                'Train R²': train_r2,
-                'Test R²': test_r2,
-                'Train MAE': train_mae,
-                'Test MAE': test_mae,
-                'Train RMSE': train_rmse,
-                'Test RMSE': test_rmse,
-                'CV R² Mean': cv_scores.mean(),
-                'CV R² Std': cv_scores.std()
-            })
-            
-            print(f"  Test R²: {test_r2:.4f}")
-            print(f"  Test MAE: ₹{test_mae:,.0f}")
-            print(f"  Test RMSE: ₹{test_rmse:,.0f}")
+            print(f"\n{name}:")
+            print(f"  Test R²: {result['Test R²']:.4f}")
+            print(f"  Test MAE: ₹{result['Test MAE']:,.0f}")
+            print(f"  Test RMSE: ₹{result['Test RMSE']:,.0f}")
         
         # Create results DataFrame
         results_df = pd.DataFrame(results)
@@ -242,10 +523,14 @@ class PropertyMLAnalyzer:
         
         return X_train, X_test, y_train, y_test, results_df
     
-    def analyze_best_model(self, X_test, y_test, results_df):
+    def analyze_best_model(self, X_test, y_test, results_df, save_plots=True):
         """Analyze the best performing model"""
         print("\n=== BEST MODEL ANALYSIS ===")
         
+        if save_plots:
+            import matplotlib.pyplot as plt
+            import seaborn as sns
+        
         # Find best model
         best_model_name = results_df.loc[results_df['Test R²'].idxmax(), 'Model']
         best_model = self.models[best_model_name]
@@ -266,12 +551,13 @@ class PropertyMLAnalyzer:
             print(feature_importance_df)
             
             # Plot feature importance
-            plt.figure(figsize=(10, 6))
-            sns.barplot(data=feature_importance_df.head(10), x='Importance', y='Feature')
-            plt.title(f'Top 10 Feature Importances - {best_model_name}')
-            plt.tight_layout()
-            plt.savefig('../docs/plots/feature_importance.png', dpi=300, bbox_inches='tight')
-            plt.show()
+            if save_plots:
+                fig = plt.figure(figsize=(10, 6))
+                sns.barplot(data=feature_importance_df.head(10), x='Importance', y='Feature')
+                plt.title(f'Top 10 Feature Importances - {best_model_name}')
+                plt.tight_layout()
+                plt.savefig('../docs/plots/feature_importance.png', dpi=300, bbox_inches='tight')
+                plt.close(fig)
         
         elif hasattr(best_model, 'coef_'):
             # Linear model coefficients
@@ -290,17 +576,18 @@ class PropertyMLAnalyzer:
             self._export_linear_model_params(best_model, feature_names)
         
         # Prediction vs Actual plot
-        y_pred = best_model.predict(X_test)
-        
-        plt.figure(figsize=(10, 6))
-        plt.scatter(y_test, y_pred, alpha=0.6)
-        plt.plot([y_test.min(), y_test.max()], [y_test.min(), y_test.max()], 'r--', lw=2)
-        plt.xlabel('Actual Price (₹)')
-        plt.ylabel('Predicted Price (₹)')
-        plt.title(f'Actual vs Predicted Prices - {best_model_name}')
-        plt.tight_layout()
-        plt.savefig('../docs/plots/prediction_scatter.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        if save_plots:
+            y_pred = best_model.predict(X_test)
+            
+            fig = plt.figure(figsize=(10, 6))
+            plt.scatter(y_test, y_pred, alpha=0.6)
+            plt.plot([y_test.min(), y_test.max()], [y_test.min(), y_test.max()], 'r--', lw=2)
+            plt.xlabel('Actual Price (₹)')
+            plt.ylabel('Predicted Price (₹)')
+            plt.title(f'Actual vs Predicted Prices - {best_model_name}')
+            plt.tight_layout()
+            plt.savefig('../docs/plots/prediction_scatter.png', dpi=300, bbox_inches='tight')
+            plt.close(fig)
         
         return best_model_name, best_model
     
@@ -317,6 +604,14 @@ class PropertyMLAnalyzer:
             'feature_scales': self.scalers['features'].scale_.tolist()
         }
         
+        # Fold the standardization into the weights: y = bias_folded + x · weights_folded
+        scaler = self.scalers['features']
+        coef = np.asarray(model.coef_, dtype=np.float64)
+        mean = scaler.mean_.astype(np.float64)
+        scale = scaler.scale_.astype(np.float64)
+        weights_folded = (coef / scale).astype(np.float32)
+        bias_folded = float(model.intercept_ - (coef * mean / scale).sum())
+        
         # Save as text file for easy C++ loading
         with open('../data/model_params.txt', 'w') as f:
             f.write(f"model_type={model_params['model_type']}\n")
@@ -333,17 +628,28 @@ class PropertyMLAnalyzer:
             f.write("feature_scales=")
             f.write(','.join(map(str, model_params['feature_scales'])))
             f.write('\n')
+            f.write("weights_folded=")
+            f.write(','.join(map(str, weights_folded)))
+            f.write('\n')
+            f.write(f"bias_folded={bias_folded}\n")
         
-        # Also save categorical encoders
+        # Also save categorical encoders as class -> code maps, ordered by code
+        encoder_maps = {col: {str(cls): i for i, cls in enumerate(categories)}
+                        for col, categories in self.encoders.items()}
+        with open('../data/encoders.json', 'w') as f:
+            json.dump(encoder_maps, f, indent=2, ensure_ascii=False)
+        
+        # Deprecated: comma-joined class lists, kept for existing loaders
         with open('../data/encoders.txt', 'w') as f:
-            for col, encoder in self.encoders.items():
+            for col, categories in self.encoders.items():
                 f.write(f"{col}_classes=")
-                f.write(','.join(encoder.classes_))
+                f.write(','.join(map(str, categories)))
                 f.write('\n')
         
         print("Model parameters exported for C++ implementation:")
         print("  - ../data/model_params.txt")
-        print("  - ../data/encoders.txt")
+        print("  - ../data/encoders.json")
+        print("  - ../data/encoders.txt (deprecated)")
     
     def save_models(self):
         """Save trained models"""
@@ -352,12 +658,14 @@ class PropertyMLAnalyzer:
         
         for name, model in self.models.items():
             filename = os.path.join(model_dir, f"{name.lower().replace(' ', '_')}.joblib")
-            joblib.dump(model, filename)
+            joblib.dump(model, filename, compress=MODEL_COMPRESSION, protocol=pickle.HIGHEST_PROTOCOL)
             print(f"Saved {name} to {filename}")
         
         # Save scalers and encoders
-        joblib.dump(self.scalers, os.path.join(model_dir, 'scalers.joblib'))
-        joblib.dump(self.encoders, os.path.join(model_dir, 'encoders.joblib'))
+        joblib.dump(self.scalers, os.path.join(model_dir, 'scalers.joblib'),
+                    compress=MODEL_COMPRESSION, protocol=pickle.HIGHEST_PROTOCOL)
+        joblib.dump(self.encoders, os.path.join(model_dir, 'encoders.joblib'),
+                    compress=MODEL_COMPRESSION, protocol=pickle.HIGHEST_PROTOCOL)
     
     def generate_ml_report(self, results_df, best_model_name):
         """Generate comprehensive ML analysis report"""
@@ -367,7 +675,7 @@ class PropertyMLAnalyzer:
             f.write("# Property Price Prediction - ML Analysis Report\n\n")
             
             f.write("## Dataset Overview\n")
-            f.write(f"- **Total Properties**: {len(self.df):,}\n")
+            f.write(f"- **Total Properties**: {self._n_properties:,}\n")
             f.write(f"- **Features Used**: {len(self.feature_columns)}\n")
             f.write(f"- **Target Variable**: {self.target_column}\n\n")
             
@@ -391,11 +699,14 @@ class PropertyMLAnalyzer:
             f.write("1. **Model Type**: Linear Regression (easiest to implement)\n")
             f.write("2. **Feature Scaling**: StandardScaler normalization required\n")
             f.write("3. **Categorical Encoding**: Label encoding for City and Type\n")
-            f.write("4. **Key Features**: Size, Bedrooms, City, Type show highest importance\n\n")
+            f.write("4. **Key Features**: Size, Bedrooms, City, Type show highest importance\n")
+            f.write("5. **Folded Parameters**: Use `weights_folded`/`bias_folded` from `model_params.txt` "
+                    "directly on raw features (`bias_folded + x · weights_folded`); no separate scaling pass is needed\n\n")
             
             f.write("## Files Generated\n\n")
             f.write("- `model_params.txt`: Model coefficients and parameters\n")
-            f.write("- `encoders.txt`: Categorical variable encodings\n")
+            f.write("- `encoders.json`: Categorical variable encodings (class → code)\n")
+            f.write("- `encoders.txt`: Deprecated comma-separated encodings; use `encoders.json`\n")
             f.write("- `plots/`: Visualization files\n")
             f.write("- `model_comparison.csv`: Detailed model comparison\n")
         
@@ -403,10 +714,18 @@ class PropertyMLAnalyzer:
 
 def main():
     """Main analysis pipeline"""
+    parser = argparse.ArgumentParser(description="Train and compare property price models")
+    parser.add_argument('--no-plots', action='store_true',
+                        help="skip creating EDA and model plots")
+    args = parser.parse_args()
+    save_plots = not args.no_plots
     
     # Configuration
     data_file = "../data/cleaned_properties.csv"
     
+    # Compile (or load from cache) the residual kernel before workers need it
+    _fast_residual_stats(np.zeros(2), np.ones(2))
+    
     # Initialize analyzer
     analyzer = PropertyMLAnalyzer()
     
@@ -416,16 +735,16 @@ def main():
         return
     
     # Exploratory Data Analysis
-    analyzer.explore_data(save_plots=True)
+    analyzer.explore_data(save_plots=save_plots)
     
-    # Prepare features
-    X, y = analyzer.prepare_features()
+    # Prepare features (cached per input file)
+    X, y = analyzer.prepare_features_cached(data_file)
     
     # Train models
     X_train, X_test, y_train, y_test, results_df = analyzer.train_models(X, y)
     
     # Analyze best model
-    best_model_name, best_model = analyzer.analyze_best_model(X_test, y_test, results_df)
+    best_model_name, best_model = analyzer.analyze_best_model(X_test, y_test, results_df, save_plots)
     
     # Save models
     analyzer.save_models()